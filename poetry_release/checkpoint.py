@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+from poetry_release import git
+from poetry_release.exception import ResumeError
+
+if TYPE_CHECKING:
+    from typing import Any
+
+CHECKPOINT_FILE = os.path.join(".git", "poetry-release.json")
+
+
+@dataclass
+class Checkpoint:
+    start: str
+    head: str
+    version: str
+    level: str
+    date: str
+    config: dict[str, Any]
+    steps: dict[str, str | None] = field(default_factory=dict)
+
+    def done(self, msg: str, result: str | None) -> None:
+        self.steps[msg] = result
+        self.head = git.head()
+        self.save()
+
+    def rebased(self, msg: str) -> None:
+        # Rebase creates new commit instead of the recorded one
+        self.steps[msg] = git.head()
+        self.head = git.head()
+        self.save()
+
+    def verify(self) -> None:
+        if git.head() != self.head:
+            raise ResumeError(
+                "HEAD has been changed since release was interrupted."
+            )
+        # Created commits and tags should be still in history
+        for msg, result in self.steps.items():
+            if result is not None and not git.is_ancestor(result):
+                raise ResumeError(f"{result} from '{msg}' is not found.")
+
+    def save(self) -> None:
+        tmp = f"{CHECKPOINT_FILE}.tmp"
+        with open(tmp, "w") as write_checkpoint:
+            json.dump(asdict(self), write_checkpoint, indent=2)
+        os.replace(tmp, CHECKPOINT_FILE)
+
+    @staticmethod
+    def exists() -> bool:
+        return os.path.exists(CHECKPOINT_FILE)
+
+    @staticmethod
+    def load() -> Checkpoint:
+        if not Checkpoint.exists():
+            raise ResumeError("There is no interrupted release to resume.")
+        with open(CHECKPOINT_FILE, "r") as read_checkpoint:
+            checkpoint = Checkpoint(**json.load(read_checkpoint))
+        checkpoint.verify()
+        return checkpoint
+
+    @staticmethod
+    def clear() -> None:
+        if Checkpoint.exists():
+            os.remove(CHECKPOINT_FILE)
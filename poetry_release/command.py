@@ -5,12 +5,14 @@ from typing import TYPE_CHECKING, cast
 
 from cleo.helpers import argument, option
 from poetry.console.commands.command import Command
+from poetry.core.constraints.version import Version
 from poetry.core.version.exceptions import InvalidVersion
 from tomlkit.toml_document import TOMLDocument
 
-from poetry_release import git
+from poetry_release import dist, git
+from poetry_release.checkpoint import Checkpoint
 from poetry_release.config import Config
-from poetry_release.exception import UpdateVersionError
+from poetry_release.exception import PushRejectedError, UpdateVersionError
 from poetry_release.executor import Executor
 from poetry_release.replace import Replacer, Template
 from poetry_release.version import ReleaseLevel, ReleaseVersion
@@ -18,6 +20,8 @@ from poetry_release.version import ReleaseLevel, ReleaseVersion
 if TYPE_CHECKING:
     from typing import Any
 
+RELEASE_ATTEMPTS = 3
+
 
 class ReleaseCommand(Command):
     name = "release"
@@ -58,6 +62,30 @@ class ReleaseCommand(Command):
             flag=True,
             value_required=False,
         ),
+        option(
+            "resume",
+            description="Resume interrupted release from the failed step",
+            flag=True,
+            value_required=False,
+        ),
+        option(
+            "build",
+            description="Build wheel and sdist of the release version",
+            flag=True,
+            value_required=False,
+        ),
+        option(
+            "publish",
+            description="Publish the release version after push",
+            flag=True,
+            value_required=False,
+        ),
+        option(
+            "repository",
+            "r",
+            description="The repository to publish the package to",
+            flag=False,
+        ),
     ]
 
     help = """\
@@ -67,13 +95,6 @@ to project repository. Supported release levels are:
 major, minor, patch, release, rc, beta, alpha.
 """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.executor = Executor(
-            self.io,
-            self.option("dry-run"),
-        )
-
     def handle(self) -> int:
         try:
             # Init config
@@ -98,115 +119,247 @@ major, minor, patch, release, rc, beta, alpha.
                 )
                 return 1
 
-            if git.has_modified():
+            with git.lock():
+                if self.option("resume"):
+                    checkpoint: Checkpoint | None = Checkpoint.load()
+                else:
+                    checkpoint = self.prepare(cfg)
+                if checkpoint is None:
+                    return 1
+                # Interrupted release is continued with its own settings
+                cfg = Config(**checkpoint.config)
+
+                for attempt in range(1, RELEASE_ATTEMPTS + 1):
+                    release = ReleaseVersion(
+                        version=Version.parse(checkpoint.version),
+                        release_level=ReleaseLevel.parse(checkpoint.level),
+                    )
+                    # Version could be changed after rebase
+                    if attempt > 1 and not self.confirm_release(release):
+                        return 1
+                    expected = None if cfg.disable_push else git.remote_head()
+                    try:
+                        self.plan(cfg, release, expected, checkpoint).run()
+                        break
+                    except PushRejectedError:
+                        if attempt == RELEASE_ATTEMPTS:
+                            raise
+                        # Completed steps are dropped with the reset
+                        Checkpoint.clear()
+                        git.reset(checkpoint.start)
+                        git.pull_rebase()
+                        checkpoint = Checkpoint(
+                            start=git.head(),
+                            head=git.head(),
+                            version=self.read_version().text,
+                            level=checkpoint.level,
+                            date=checkpoint.date,
+                            config=checkpoint.config,
+                        )
+                        self.line(
+                            "<fg=yellow>Remote branch has been updated.</>"
+                        )
+
+                if not self.option("dry-run"):
+                    Checkpoint.clear()
+
+        except RuntimeError as e:
+            self.line(f"<fg=red>{e}</>")
+            if Checkpoint.exists():
                 self.line(
-                    "<fg=yellow>There are uncommitted changes "
-                    "in the repository. Please make a commit.</>"
+                    "<fg=yellow>Run release with --resume "
+                    "to continue from the failed step.</>"
                 )
-                return 1
+            return 1
+        except InvalidVersion as e:
+            self.line(f"<fg=yellow>{e}</>")
+            return 1
+        except UpdateVersionError as e:
+            self.line(f"<fg=yellow>{e}</>")
+            return 1
+        return 0
 
-            release = ReleaseVersion(
-                version=self.poetry.package.version,
-                release_level=ReleaseLevel.parse(self.argument("level")),
+    def prepare(self, cfg: Config) -> Checkpoint | None:
+        if cfg.publish and cfg.disable_push:
+            self.line(
+                "<fg=yellow>Release can't be published "
+                "without push. Please enable push.</>"
             )
+            return None
 
+        if Checkpoint.exists():
             if not self.confirm(
-                (
-                    f"Release {self.poetry.package.name} "
-                    f"{release.next_version}?"
-                ),
+                "Previous release was interrupted. Discard it?",
                 False,
                 "(?i)^(y|j)",
             ):
-                return 1
-
-            if release.current_version == release.next_version:
-                self.line("<fg=yellow>Version doesn't changed.</>")
-                return 1
+                self.line(
+                    "<fg=yellow>Run release with --resume to continue it.</>"
+                )
+                return None
+            Checkpoint.clear()
 
-            tmpl = Template(
-                package_name=self.poetry.package.name,
-                prev_version=release.current_version,
-                version=release.next_version,
-                next_version=release.next_pre_version
-                if release.has_next_pre_version
-                else "",
-                date=datetime.today().strftime("%Y-%m-%d"),
+        if git.has_modified():
+            self.line(
+                "<fg=yellow>There are uncommitted changes "
+                "in the repository. Please make a commit.</>"
             )
+            return None
 
-            replacer = Replacer(tmpl, cfg)
-            replacer.update_replacements()
-            message = replacer.generate_messages()
+        release = ReleaseVersion(
+            version=self.poetry.package.version,
+            release_level=ReleaseLevel.parse(self.argument("level")),
+        )
 
-            # Set release version
-            self.executor.add(
-                lambda: self.set_version(release.next_version),
-                True,
-                f"Set version {tmpl.package_name} {tmpl.next_version}.",
-            )
-            # Create git commit
-            self.executor.add(
-                lambda: git.create_commit(
-                    message.release_commit, cfg.sign_commit
-                ),
-                True,
-                "Create git commit.",
-            )
-            # Push commit with release version
-            self.executor.add(
-                lambda: git.push_commit(),
-                not cfg.disable_push,
-                "Push commit with release version.",
-            )
-            # Create tag with release version
-            self.executor.add(
-                lambda: git.create_tag(
-                    message.tag_name, message.tag_message, cfg.sign_tag
-                ),
-                not cfg.disable_tag,
-                "Create tag with release version.",
-            )
-            # Push tag with release version
-            self.executor.add(
-                lambda: git.push_tag(message.tag_name),
-                not (cfg.disable_tag or cfg.disable_push),
-                f"Push tag({tmpl.version}) with release version.",
-            )
-            # Set next iteration version
-            self.executor.add(
-                lambda: self.set_version(release.next_pre_version),
-                not release.has_next_pre_version,
-                f"Set next version {tmpl.package_name} {tmpl.next_version}.",
-            )
-            # Create commit with next iteration version
-            self.executor.add(
-                lambda: git.create_commit(
-                    message.post_release_commit, cfg.sign_commit
-                ),
-                not (not release.has_next_pre_version or cfg.disable_dev),
-                "Create commit with next iteration version.",
-            )
-            # Push commit with next iteration version
-            self.executor.add(
-                lambda: git.push_commit(),
-                not (
-                    not release.has_next_pre_version
-                    or cfg.disable_dev
-                    or cfg.disable_push
-                ),
-                "Push commit with next iteration version.",
-            )
+        if not self.confirm_release(release):
+            return None
 
-        except RuntimeError as e:
-            self.line(f"<fg=red>{e}</>")
-            return 1
-        except InvalidVersion as e:
-            self.line(f"<fg=yellow>{e}</>")
-            return 1
-        except UpdateVersionError as e:
-            self.line(f"<fg=yellow>{e}</>")
-            return 1
-        return 0
+        return Checkpoint(
+            start=git.head(),
+            head=git.head(),
+            version=release.current_version,
+            level=release.release_level.value,
+            date=datetime.today().strftime("%Y-%m-%d"),
+            config=cfg.to_dict(),
+        )
+
+    def confirm_release(self, release: ReleaseVersion) -> bool:
+        if not self.confirm(
+            (
+                f"Release {self.poetry.package.name} "
+                f"{release.next_version}?"
+            ),
+            False,
+            "(?i)^(y|j)",
+        ):
+            return False
+
+        if release.current_version == release.next_version:
+            self.line("<fg=yellow>Version doesn't changed.</>")
+            return False
+        return True
+
+    def plan(
+        self,
+        cfg: Config,
+        release: ReleaseVersion,
+        expected: str | None,
+        checkpoint: Checkpoint,
+    ) -> Executor:
+        if not self.option("dry-run"):
+            checkpoint.save()
+        executor = Executor(self.io, self.option("dry-run"), checkpoint)
+
+        tmpl = Template(
+            package_name=self.poetry.package.name,
+            prev_version=release.current_version,
+            version=release.next_version,
+            next_version=release.next_pre_version
+            if not release.has_next_pre_version
+            else "",
+            date=checkpoint.date,
+        )
+        # Development iteration starts only after stable release
+        dev = not (release.has_next_pre_version or cfg.disable_dev)
+
+        replacer = Replacer(tmpl, cfg)
+        message = replacer.generate_messages()
+
+        # Update release replacements
+        executor.add(
+            lambda: replacer.update_replacements(),
+            bool(replacer.replacements),
+            "Update release replacements.",
+        )
+        # Set release version
+        executor.add(
+            lambda: self.set_version(release.next_version),
+            True,
+            f"Set version {tmpl.package_name} {tmpl.version}.",
+        )
+        # Create git commit
+        executor.add(
+            lambda: git.create_commit(message.release_commit, cfg.sign_commit),
+            True,
+            "Create git commit.",
+        )
+        # Build artifacts while release version is pushed
+        root = self.poetry.file.path.parent
+        executor.add(
+            lambda: dist.build(root, "wheel"),
+            cfg.build or cfg.publish,
+            "Build wheel.",
+            background=True,
+        )
+        executor.add(
+            lambda: dist.build(root, "sdist"),
+            cfg.build or cfg.publish,
+            "Build sdist.",
+            background=True,
+        )
+        # Push commit with release version
+        executor.add(
+            lambda: git.push_commit(expected),
+            not cfg.disable_push,
+            "Push commit with release version.",
+        )
+        # Create tag with release version
+        executor.add(
+            lambda: git.create_tag(
+                message.tag_name, message.tag_message, cfg.sign_tag
+            ),
+            not cfg.disable_tag,
+            "Create tag with release version.",
+        )
+        # Push tag with release version
+        executor.add(
+            lambda: git.push_tag(message.tag_name),
+            not (cfg.disable_tag or cfg.disable_push),
+            f"Push tag({tmpl.version}) with release version.",
+        )
+        # Publish artifacts after release version is pushed
+        executor.add(
+            lambda: dist.publish(
+                root,
+                self.io,
+                cfg.publish_repository,
+                # Artifacts could be partially uploaded before interruption
+                skip_existing=self.option("resume"),
+            ),
+            cfg.publish,
+            f"Publish {tmpl.package_name} {tmpl.version}.",
+            wait=True,
+        )
+        # Set next iteration version
+        executor.add(
+            lambda: self.set_version(release.next_pre_version),
+            dev,
+            f"Set next version {tmpl.package_name} {tmpl.next_version}.",
+            wait=True,
+        )
+        # Create commit with next iteration version
+        next_commit = "Create commit with next iteration version."
+        executor.add(
+            lambda: git.create_commit(
+                message.post_release_commit, cfg.sign_commit
+            ),
+            dev,
+            next_commit,
+        )
+        # Push commit with next iteration version
+        executor.add(
+            lambda: git.push_rebased(
+                RELEASE_ATTEMPTS, lambda: checkpoint.rebased(next_commit)
+            ),
+            dev and not cfg.disable_push,
+            "Push commit with next iteration version.",
+        )
+
+        return executor
+
+    def read_version(self) -> Version:
+        content: dict[str, Any] = self.poetry.file.read()
+        return Version.parse(content["tool"]["poetry"]["version"])
 
     def set_version(self, version: str) -> None:
         content: dict[str, Any] = self.poetry.file.read()
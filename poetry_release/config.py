@@ -19,6 +19,9 @@ class Config:
         release_commit_message: str | None = None,
         post_release_commit_message: str | None = None,
         release_replacements: list[dict[str, str]] | None = None,
+        build: bool | None = None,
+        publish: bool | None = None,
+        publish_repository: str | None = None,
     ) -> None:
         self._disable_push = disable_push
         self._disable_tag = disable_tag
@@ -30,6 +33,9 @@ class Config:
         self._release_commit_message = release_commit_message
         self._post_release_commit_message = post_release_commit_message
         self._release_replacements = release_replacements
+        self._build = build
+        self._publish = publish
+        self._publish_repository = publish_repository
 
     @property
     def disable_push(self) -> bool:
@@ -75,6 +81,21 @@ class Config:
             else []
         )
 
+    @property
+    def build(self) -> bool:
+        return self._build if self._build is not None else False
+
+    @property
+    def publish(self) -> bool:
+        return self._publish if self._publish is not None else False
+
+    @property
+    def publish_repository(self) -> str | None:
+        return self._publish_repository
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key[1:]: value for key, value in self.__dict__.items()}
+
     def update(self, cfg: Config) -> None:
         for key, value in cfg.__dict__.items():
             if value is not None:
@@ -95,6 +116,9 @@ class Config:
             release_replacements=pyproject.get("release-replacements"),
             sign_commit=pyproject.get("sign-commit"),
             sign_tag=pyproject.get("sign-tag"),
+            build=pyproject.get("build"),
+            publish=pyproject.get("publish"),
+            publish_repository=pyproject.get("publish-repository"),
         )
 
     @staticmethod
@@ -103,4 +127,7 @@ class Config:
             disable_push=cli("disable-push"),
             disable_tag=cli("disable-tag"),
             disable_dev=cli("disable-dev"),
+            build=cli("build"),
+            publish=cli("publish"),
+            publish_repository=cli("repository"),
         )
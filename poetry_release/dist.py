@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from poetry.core.factory import Factory as CoreFactory
+from poetry.core.masonry.builders.sdist import SdistBuilder
+from poetry.core.masonry.builders.wheel import WheelBuilder
+from poetry.factory import Factory
+from poetry.publishing import Publisher
+from poetry.publishing.uploader import Uploader, UploadError
+
+if TYPE_CHECKING:
+    from cleo.io.io import IO
+    from poetry.core.masonry.builders.builder import Builder
+
+
+BUILDERS: dict[str, type[Builder]] = {
+    "wheel": WheelBuilder,
+    "sdist": SdistBuilder,
+}
+
+
+def build(root: Path, fmt: str) -> None:
+    # Project is loaded here since pyproject.toml is changed during release
+    poetry = CoreFactory().create_poetry(root)
+    target_dir = root / "dist"
+    target_dir.mkdir(parents=True, exist_ok=True)
+    BUILDERS[fmt](poetry).build(target_dir)
+
+
+def publish(
+    root: Path,
+    io: IO,
+    repository: str | None,
+    skip_existing: bool = False,
+) -> None:
+    poetry = Factory().create_poetry(root, io=io)
+    if repository is not None and repository.startswith("file://"):
+        target_dir = Path(url2pathname(urlparse(repository).path))
+        target_dir.mkdir(parents=True, exist_ok=True)
+        # Behaves like package index which rejects existing files
+        for file in Uploader(poetry, io).files:
+            target = target_dir / file.name
+            if target.exists() and skip_existing:
+                continue
+            if target.exists():
+                raise UploadError(f"File {file.name} already exists")
+            shutil.copy(file, target)
+        return
+    Publisher(poetry, io).publish(
+        repository, None, None, skip_existing=skip_existing
+    )
@@ -1,2 +1,14 @@
 class UpdateVersionError(ValueError):
     pass
+
+
+class GitError(RuntimeError):
+    pass
+
+
+class PushRejectedError(GitError):
+    pass
+
+
+class ResumeError(RuntimeError):
+    pass
@@ -1,46 +1,91 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from cleo.io.outputs.output import Verbosity
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from typing import Callable
 
     from cleo.io.io import IO
 
+    from poetry_release.checkpoint import Checkpoint
+
 
 class Handler:
     def __init__(
         self,
-        func: Callable[[], None],
+        func: Callable[[], str | None],
         execute: bool,
         msg: str,
+        background: bool = False,
+        wait: bool = False,
     ) -> None:
         self.func = func
         self.execute = execute
         self.msg = msg
+        self.background = background
+        self.wait = wait
 
 
 class Executor:
-    def __init__(self, io: IO, dry_run: bool | None) -> None:
+    def __init__(
+        self,
+        io: IO,
+        dry_run: bool | None,
+        checkpoint: Checkpoint | None = None,
+    ) -> None:
         self._io = io
         self._handlers: list[Handler] = []
         self._dry_run = dry_run
+        self._checkpoint = checkpoint
 
     def add(
         self,
-        func: Callable[[], None],
+        func: Callable[[], str | None],
         execute: bool,
         msg: str,
+        background: bool = False,
+        wait: bool = False,
     ) -> None:
-        handler = Handler(func, execute, msg)
+        handler = Handler(func, execute, msg, background, wait)
         self._handlers.append(handler)
 
     def run(self) -> None:
-        for handler in filter(lambda x: x.execute, self._handlers):
-            text = f"<info>{handler.msg}</>"
-            self._io.write_line(text, verbosity=Verbosity.NORMAL)
-            if self._dry_run:
-                return
-            handler.func()
+        with ThreadPoolExecutor() as pool:
+            pending: list[tuple[Handler, Future[str | None]]] = []
+            for handler in filter(lambda x: x.execute, self._handlers):
+                if self._is_done(handler):
+                    text = f"<comment>{handler.msg} Already done.</>"
+                    self._io.write_line(text, verbosity=Verbosity.NORMAL)
+                    continue
+                if handler.wait:
+                    self._wait(pending)
+                text = f"<info>{handler.msg}</>"
+                self._io.write_line(text, verbosity=Verbosity.NORMAL)
+                if self._dry_run:
+                    return
+                if handler.background:
+                    pending.append((handler, pool.submit(handler.func)))
+                else:
+                    self._done(handler, handler.func())
+            self._wait(pending)
+
+    def _wait(
+        self,
+        pending: list[tuple[Handler, Future[str | None]]],
+    ) -> None:
+        while pending:
+            handler, future = pending.pop(0)
+            self._done(handler, future.result())
+
+    def _is_done(self, handler: Handler) -> bool:
+        if self._checkpoint is None:
+            return False
+        return handler.msg in self._checkpoint.steps
+
+    def _done(self, handler: Handler, result: str | None) -> None:
+        if self._checkpoint is not None:
+            self._checkpoint.done(handler.msg, result)
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
+import os
 import subprocess
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from poetry_release.exception import GitError, PushRejectedError
+
+if TYPE_CHECKING:
+    from typing import Callable, Iterator
+
+LOCK_FILE = os.path.join(".git", "poetry-release.lock")
 
 
 def has_modified() -> bool:
@@ -13,35 +23,152 @@ def has_modified() -> bool:
     return bool(result.returncode)
 
 
-def create_tag(version: str, message: str, sign: bool) -> None:
+def create_tag(version: str, message: str, sign: bool) -> str:
     command = ["git", "tag"]
     if sign:
         command += ["-s"]
     command += ["-a", f"{version}", "-m", f"{message}"]
-    subprocess.run(command)
+    result = subprocess.run(command)
+    if result.returncode:
+        raise GitError(f"Failed to create tag {version}")
+    return version
 
 
-def create_commit(message: str, sign: bool) -> None:
+def create_commit(message: str, sign: bool) -> str:
     command = ["git", "commit"]
     if sign:
         command += ["-S"]
     command += ["-a", "-m", f"{message}"]
-    subprocess.run(command)
+    result = subprocess.run(command)
+    if result.returncode:
+        raise GitError("Failed to create commit")
+    return head()
 
 
-def push_commit() -> None:
+def push_commit(expected: str | None = None) -> None:
     branch = __current_branch()
     remote = __get_remote()
     if remote is None:
         remote = "origin"
-    subprocess.run(["git", "push", f"{remote}", f"{branch}"])
+    if expected and not is_ancestor(expected):
+        raise PushRejectedError(f"Remote {remote}/{branch} is ahead")
+    command = ["git", "push"]
+    if expected is not None:
+        command += [
+            "--atomic",
+            f"--force-with-lease=refs/heads/{branch}:{expected}",
+        ]
+    command += [f"{remote}", f"{branch}"]
+    result = subprocess.run(command)
+    # Only moved remote branch is a conflict, other failures aren't retried
+    if result.returncode and expected is not None:
+        if remote_head() != expected:
+            raise PushRejectedError(
+                f"Remote {remote}/{branch} has been updated"
+            )
+    if result.returncode:
+        raise GitError(f"Failed to push {branch} to {remote}")
+
+
+def push_rebased(
+    attempts: int, rebased: Callable[[], None] | None = None
+) -> None:
+    # Rebase local commits while remote branch is moved by somebody else
+    for attempt in range(1, attempts + 1):
+        try:
+            push_commit(remote_head())
+            return
+        except PushRejectedError as e:
+            if attempt == attempts:
+                raise GitError(str(e))
+            pull_rebase()
+            if rebased is not None:
+                rebased()
 
 
 def push_tag(version: str) -> None:
     remote = __get_remote()
     if remote is None:
         remote = "origin"
-    subprocess.run(["git", "push", f"{remote}", f"{version}"])
+    result = subprocess.run(["git", "push", f"{remote}", f"{version}"])
+    if result.returncode:
+        raise GitError(f"Failed to push tag {version} to {remote}")
+
+
+def head(ref: str = "HEAD") -> str:
+    result = subprocess.run(
+        ["git", "rev-parse", "--verify", f"{ref}"],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    if result.returncode:
+        raise GitError(f"Failed to resolve {ref}")
+    return result.stdout.strip()
+
+
+def remote_head() -> str:
+    branch = __current_branch()
+    remote = __get_remote()
+    if remote is None:
+        remote = "origin"
+    result = subprocess.run(
+        ["git", "ls-remote", f"{remote}", f"refs/heads/{branch}"],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    if result.returncode:
+        raise GitError(f"Failed to fetch {branch} head from {remote}")
+    # Empty value means that branch doesn't exist on remote yet
+    return result.stdout.split("\t")[0].strip()
+
+
+def is_ancestor(ref: str) -> bool:
+    result = subprocess.run(
+        ["git", "merge-base", "--is-ancestor", f"{ref}", "HEAD"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    return not result.returncode
+
+
+def reset(ref: str) -> None:
+    result = subprocess.run(["git", "reset", "--hard", f"{ref}"])
+    if result.returncode:
+        raise GitError(f"Failed to reset to {ref}")
+
+
+def pull_rebase() -> None:
+    branch = __current_branch()
+    remote = __get_remote()
+    if remote is None:
+        remote = "origin"
+    result = subprocess.run(
+        ["git", "pull", "--rebase", f"{remote}", f"{branch}"]
+    )
+    if result.returncode:
+        subprocess.run(
+            ["git", "rebase", "--abort"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        raise GitError(f"Failed to rebase {branch} onto {remote}/{branch}")
+
+
+@contextmanager
+def lock() -> Iterator[None]:
+    try:
+        fd = os.open(LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        raise GitError(
+            "Another release is in progress. "
+            f"Remove {LOCK_FILE} if it isn't."
+        )
+    try:
+        os.write(fd, f"{os.getpid()}\n".encode())
+        os.close(fd)
+        yield
+    finally:
+        os.remove(LOCK_FILE)
 
 
 def repo_exists() -> bool:
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from cleo.testers.command_tester import CommandTester
+from poetry.console.application import Application
+
+from poetry_release.command import ReleaseCommand
+from tests.helpers import PYPROJECT, git
+
+if TYPE_CHECKING:
+    from typing import Callable, Tuple
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch: pytest.MonkeyPatch) -> None:
+    for kind in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{kind}_NAME", "Demo")
+        monkeypatch.setenv(f"GIT_{kind}_EMAIL", "demo@example.com")
+
+
+@pytest.fixture
+def remote(tmp_path: Path) -> Path:
+    path = tmp_path / "remote.git"
+    git("init", "--bare", "-b", "main", str(path))
+    return path
+
+
+@pytest.fixture
+def project(
+    tmp_path: Path, remote: Path, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    path = tmp_path / "demo"
+    (path / "demo").mkdir(parents=True)
+    (path / "demo" / "__init__.py").touch()
+    (path / "pyproject.toml").write_text(PYPROJECT)
+    (path / ".gitignore").write_text("dist/\n")
+    git("init", "-b", "main", cwd=path)
+    git("add", "-A", cwd=path)
+    git("commit", "-m", "Initial commit", cwd=path)
+    git("remote", "add", "origin", str(remote), cwd=path)
+    git("push", "-u", "origin", "main", cwd=path)
+    monkeypatch.chdir(path)
+    return path
+
+
+@pytest.fixture
+def release() -> Callable[..., Tuple[int, str]]:
+    def execute(args: str, inputs: str = "y\n") -> Tuple[int, str]:
+        # Application caches project, so it's created for every run
+        app = Application()
+        app.add(ReleaseCommand())
+        tester = CommandTester(app.find("release"))
+        code = tester.execute(args, inputs=inputs)
+        # Questions are written to error output
+        return code, tester.io.fetch_output() + tester.io.fetch_error()
+
+    return execute
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+PYPROJECT = """\
+[tool.poetry]
+name = "demo"
+version = "0.1.0"
+description = ""
+authors = ["Demo <demo@example.com>"]
+
+[tool.poetry.dependencies]
+python = "^3.7"
+
+[build-system]
+requires = ["poetry-core>=1.0.0"]
+build-backend = "poetry.core.masonry.api"
+"""
+
+
+def git(*args: str, cwd: Path | None = None) -> str:
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return result.stdout.strip()
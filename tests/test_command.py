@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry_release.checkpoint import Checkpoint
+from tests.helpers import git
+
+if TYPE_CHECKING:
+    from typing import Callable, Tuple
+
+    Release = Callable[..., Tuple[int, str]]
+
+
+def reject_pushes(remote: Path) -> Path:
+    hook = remote / "hooks" / "pre-receive"
+    hook.write_text("#!/bin/sh\nexit 1\n")
+    hook.chmod(0o755)
+    return hook
+
+
+def test_stable_release_starts_next_iteration(
+    project: Path, remote: Path, release: Release
+) -> None:
+    code, output = release("patch")
+
+    assert code == 0
+    assert "Set version demo 0.1.1." in output
+    assert "Set next version demo 0.1.2a0." in output
+    assert git("status", "--porcelain") == ""
+    assert git("log", "--format=%s", "main", cwd=remote).split("\n") == [
+        "Starting demo's next development iteration 0.1.2a0",
+        "Release demo 0.1.1",
+        "Initial commit",
+    ]
+    assert git("tag", "--list", cwd=remote) == "0.1.1"
+
+
+def test_pre_release_keeps_version(
+    project: Path, remote: Path, release: Release
+) -> None:
+    code, _ = release("alpha")
+
+    assert code == 0
+    assert git("status", "--porcelain") == ""
+    assert git("log", "--format=%s", "main", cwd=remote).split("\n") == [
+        "Release demo 0.1.0a1",
+        "Initial commit",
+    ]
+
+
+def test_disable_dev_skips_next_iteration(
+    project: Path, remote: Path, release: Release
+) -> None:
+    code, _ = release("patch --disable-dev")
+
+    assert code == 0
+    assert git("status", "--porcelain") == ""
+    assert 'version = "0.1.1"' in (project / "pyproject.toml").read_text()
+
+
+def test_build_and_publish_to_file_repository(
+    project: Path, remote: Path, release: Release, tmp_path: Path
+) -> None:
+    index = tmp_path / "index"
+
+    code, _ = release(f"patch --publish --repository {index.as_uri()}")
+
+    assert code == 0
+    assert sorted(p.name for p in index.iterdir()) == [
+        "demo-0.1.1-py3-none-any.whl",
+        "demo-0.1.1.tar.gz",
+    ]
+    assert git("tag", "--list", cwd=remote) == "0.1.1"
+
+
+def test_publish_requires_push(
+    project: Path, remote: Path, release: Release
+) -> None:
+    code, output = release("patch --publish --disable-push")
+
+    assert code == 1
+    assert "without push" in output
+    assert git("tag", "--list") == ""
+
+
+def test_release_is_recomputed_after_remote_update(
+    project: Path, remote: Path, release: Release, tmp_path: Path
+) -> None:
+    other = tmp_path / "other"
+    git("clone", str(remote), str(other))
+    pyproject = other / "pyproject.toml"
+    pyproject.write_text(pyproject.read_text().replace('"0.1.0"', '"0.2.0"'))
+    git("commit", "-am", "Bump version", cwd=other)
+    git("push", "origin", "main", cwd=other)
+
+    code, output = release("patch", inputs="y\ny\n")
+
+    assert code == 0
+    assert "Release demo 0.2.1?" in output
+    assert git("log", "-1", "--format=%s", "main~1", cwd=remote) == (
+        "Release demo 0.2.1"
+    )
+    assert git("tag", "--list", cwd=remote) == "0.2.1"
+
+
+def test_declined_version_after_rebase_stops_release(
+    project: Path, remote: Path, release: Release, tmp_path: Path
+) -> None:
+    other = tmp_path / "other"
+    git("clone", str(remote), str(other))
+    git("commit", "--allow-empty", "-m", "Other change", cwd=other)
+    git("push", "origin", "main", cwd=other)
+
+    code, _ = release("patch", inputs="y\nn\n")
+
+    assert code == 1
+    assert git("rev-parse", "HEAD") == git("rev-parse", "main", cwd=remote)
+    assert git("tag", "--list") == ""
+    assert not Checkpoint.exists()
+
+
+def test_failed_push_is_resumed(
+    project: Path, remote: Path, release: Release
+) -> None:
+    hook = reject_pushes(remote)
+
+    code, output = release("patch")
+
+    assert code == 1
+    assert "--resume" in output
+    # Hook failure isn't a conflict, so release commit is kept
+    assert git("log", "-1", "--format=%s") == "Release demo 0.1.1"
+    assert Checkpoint.exists()
+
+    hook.unlink()
+    code, output = release("patch --resume", inputs="")
+
+    assert code == 0
+    assert "Create git commit. Already done." in output
+    assert git("log", "-1", "--format=%s", "main~1", cwd=remote) == (
+        "Release demo 0.1.1"
+    )
+    assert git("tag", "--list", cwd=remote) == "0.1.1"
+    assert not Checkpoint.exists()
+
+
+def test_resume_refuses_moved_head(
+    project: Path, remote: Path, release: Release
+) -> None:
+    hook = reject_pushes(remote)
+    release("patch")
+    hook.unlink()
+    git("commit", "--allow-empty", "-m", "Unrelated change")
+
+    code, output = release("patch --resume", inputs="")
+
+    assert code == 1
+    assert "HEAD has been changed" in output
+    assert git("tag", "--list", cwd=remote) == ""
+
+
+def test_resume_uses_settings_of_interrupted_release(
+    project: Path, remote: Path, release: Release, tmp_path: Path
+) -> None:
+    index = tmp_path / "index"
+    hook = reject_pushes(remote)
+    release(f"patch --publish --repository {index.as_uri()}")
+    hook.unlink()
+
+    code, _ = release("patch --resume", inputs="")
+
+    assert code == 0
+    assert sorted(p.name for p in index.iterdir()) == [
+        "demo-0.1.1-py3-none-any.whl",
+        "demo-0.1.1.tar.gz",
+    ]
+
+
+def test_interrupted_release_could_be_discarded(
+    project: Path, remote: Path, release: Release
+) -> None:
+    hook = reject_pushes(remote)
+    release("patch")
+    hook.unlink()
+
+    code, output = release("patch", inputs="n\n")
+
+    assert code == 1
+    assert "--resume" in output
+    assert Checkpoint.exists()
+
+    code, output = release("patch", inputs="y\ny\n")
+
+    assert code == 0
+    assert "Release demo 0.1.2?" in output
+    assert git("tag", "--list", cwd=remote) == "0.1.2"
+
+
+def test_resume_without_checkpoint(project: Path, release: Release) -> None:
+    code, output = release("patch --resume", inputs="")
+
+    assert code == 1
+    assert "no interrupted release" in output
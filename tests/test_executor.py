@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+from cleo.io.buffered_io import BufferedIO
+
+from poetry_release.checkpoint import Checkpoint
+from poetry_release.executor import Executor
+
+
+def test_background_handlers_overlap_until_wait() -> None:
+    started = threading.Event()
+    calls: list[str] = []
+
+    def build() -> None:
+        assert started.wait(5)
+        calls.append("build")
+
+    executor = Executor(BufferedIO(), False)
+    executor.add(build, True, "Build.", background=True)
+    executor.add(lambda: started.set(), True, "Push.")
+    executor.add(lambda: calls.append("publish"), True, "Publish.", wait=True)
+    executor.run()
+
+    assert calls == ["build", "publish"]
+
+
+def test_completed_handlers_are_skipped(project: Path) -> None:
+    checkpoint = Checkpoint("", "", "0.1.0", "patch", "2023-01-01", {})
+    calls: list[str] = []
+
+    def commit() -> str:
+        calls.append("commit")
+        return "sha"
+
+    def push() -> None:
+        calls.append("push")
+        raise RuntimeError("Network error")
+
+    executor = Executor(BufferedIO(), False, checkpoint)
+    executor.add(commit, True, "Commit.")
+    executor.add(push, True, "Push.")
+    with pytest.raises(RuntimeError):
+        executor.run()
+    assert checkpoint.steps == {"Commit.": "sha"}
+
+    executor = Executor(BufferedIO(), False, checkpoint)
+    executor.add(commit, True, "Commit.")
+    executor.add(lambda: calls.append("push"), True, "Push.")
+    executor.run()
+
+    assert calls == ["commit", "push", "push"]
+    assert list(checkpoint.steps) == ["Commit.", "Push."]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from poetry_release import git as release_git
+from poetry_release.checkpoint import Checkpoint
+from poetry_release.exception import GitError, PushRejectedError
+from tests.helpers import git
+
+
+def test_push_with_stale_lease_is_rejected(
+    project: Path, remote: Path
+) -> None:
+    expected = release_git.remote_head()
+    git("commit", "--allow-empty", "-m", "Remote change")
+    git("push", "origin", "main")
+    git("reset", "--hard", "HEAD~1")
+    git("commit", "--allow-empty", "-m", "Local change")
+
+    with pytest.raises(PushRejectedError):
+        release_git.push_commit(expected)
+
+
+def test_push_failure_is_not_a_conflict(project: Path, remote: Path) -> None:
+    hook = remote / "hooks" / "pre-receive"
+    hook.write_text("#!/bin/sh\nexit 1\n")
+    hook.chmod(0o755)
+    git("commit", "--allow-empty", "-m", "Local change")
+
+    with pytest.raises(GitError) as e:
+        release_git.push_commit(release_git.remote_head())
+    assert not isinstance(e.value, PushRejectedError)
+
+
+def test_push_rebased_after_remote_update(
+    project: Path, remote: Path, tmp_path: Path
+) -> None:
+    other = tmp_path / "other"
+    git("clone", str(remote), str(other))
+    git("commit", "--allow-empty", "-m", "Remote change", cwd=other)
+    git("push", "origin", "main", cwd=other)
+    git("commit", "--allow-empty", "-m", "Local change")
+
+    release_git.push_rebased(2)
+
+    assert git("log", "--format=%s", "main", cwd=remote).split("\n") == [
+        "Local change",
+        "Remote change",
+        "Initial commit",
+    ]
+
+
+def test_rebased_commit_is_journaled(
+    project: Path, remote: Path, tmp_path: Path
+) -> None:
+    other = tmp_path / "other"
+    git("clone", str(remote), str(other))
+    git("commit", "--allow-empty", "-m", "Remote change", cwd=other)
+    git("push", "origin", "main", cwd=other)
+    checkpoint = Checkpoint("", "", "0.1.0", "patch", "2023-01-01", {})
+    git("commit", "--allow-empty", "-m", "Local change")
+    checkpoint.done("Commit.", release_git.head())
+    # Push fails after rebase, e.g. on network error
+    hook = remote / "hooks" / "pre-receive"
+    hook.write_text("#!/bin/sh\nexit 1\n")
+    hook.chmod(0o755)
+
+    with pytest.raises(GitError):
+        release_git.push_rebased(2, lambda: checkpoint.rebased("Commit."))
+
+    assert Checkpoint.load().steps["Commit."] == release_git.head()
+
+
+def test_lock_is_exclusive(project: Path) -> None:
+    with release_git.lock():
+        with pytest.raises(GitError):
+            with release_git.lock():
+                pass
+    with release_git.lock():
+        pass